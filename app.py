@@ -3,14 +3,24 @@ from __future__ import annotations
 import os
 import time
 import hashlib
+import hmac
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Tuple, Optional
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from jinja2 import DictLoader
 
-from flask import Flask, request, redirect, url_for, render_template_string, session, abort
+from flask import Flask, request, redirect, url_for, render_template, session, flash, abort
+from flask.sessions import SecureCookieSessionInterface
+from flask_compress import Compress
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 # ============================================================
 # SETTINGS (set these in Render -> Environment)
@@ -22,6 +32,8 @@ DATABASE_URL = os.environ.get("DATABASE_URL", "")  # Neon/Supabase/Render Postgr
 SECRET_KEY = os.environ.get("SECRET_KEY", "change-me")
 FAMILY_CODE = os.environ.get("FAMILY_CODE", "")    # one shared code for your family
 PARENT_PIN = os.environ.get("PARENT_PIN", "")      # parent-only pages
+DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))  # >= gunicorn threads per worker
+DB_PING_IDLE = int(os.environ.get("DB_PING_IDLE", "30"))  # seconds idle before a pooled conn is re-checked
 
 if not DATABASE_URL:
     # Don't crash immediately—show a helpful page instead.
@@ -31,15 +43,89 @@ else:
 
 app = Flask(__name__)
 app.secret_key = SECRET_KEY
+# Render sits one proxy in front: take the client address from X-Forwarded-For
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)
+# static files carry a ?v= fingerprint, so browsers may cache them for a year
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
+# templates are string constants in this file: never re-check them for changes
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+# the pages are repetitive table markup; gzip/br shrinks them a lot
+app.config["COMPRESS_MIMETYPES"] = ["text/html"]
+app.config["COMPRESS_LEVEL"] = 5
+# compressing a streamed response drains it first; leave those untouched
+app.config["COMPRESS_STREAMS"] = False
+Compress(app)
+
+class CachedSigningSessionInterface(SecureCookieSessionInterface):
+    # Flask builds a new cookie serializer on every request; reuse one per key.
+    _serializer = None
+    _serializer_key = None
+
+    def get_signing_serializer(self, app):
+        if self._serializer is None or self._serializer_key != app.secret_key:
+            self._serializer = super().get_signing_serializer(app)
+            self._serializer_key = app.secret_key
+        return self._serializer
+
+app.session_interface = CachedSigningSessionInterface()
 
 
 # ============================================================
 # DATABASE HELPERS
 # ============================================================
 
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_pid = 0
+_pool_lock = threading.Lock()
+_conn_idle_since: Dict[int, float] = {}  # id(conn) -> when it went back to the pool
+
+def get_pool() -> ThreadedConnectionPool:
+    # One pool per process: created lazily so forked workers never share sockets.
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                # minconn == maxconn: psycopg2 closes any returned connection beyond
+                # minconn, so a lower floor would reconnect under concurrent requests
+                _pool = ThreadedConnectionPool(DB_POOL_MAX, DB_POOL_MAX, DATABASE_URL)
+                _pool_pid = os.getpid()
+    return _pool
+
+def checkout(pool: ThreadedConnectionPool):
+    # Take a live connection. One that sat idle longer than DB_PING_IDLE gets a
+    # SELECT 1 first: the server (or Neon autosuspend) may have dropped it, and
+    # psycopg2 only notices that when a query fails.
+    while True:
+        conn = pool.getconn()
+        idle_since = _conn_idle_since.pop(id(conn), None)
+        if conn.closed:
+            pool.putconn(conn, close=True)
+            continue
+        if idle_since is None or time.time() - idle_since < DB_PING_IDLE:
+            return conn
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return conn
+        except psycopg2.Error:
+            # dead: discard it and try the next one (or a fresh connect)
+            pool.putconn(conn, close=True)
+
+@contextmanager
 def db():
-    # Note: psycopg2 connects using DATABASE_URL
-    return psycopg2.connect(DATABASE_URL)
+    # Borrow a pooled connection; the block runs as one transaction
+    # (commit on success, rollback on error), then the connection goes back.
+    pool = get_pool()
+    conn = checkout(pool)
+    try:
+        with conn:
+            yield conn
+    finally:
+        if not conn.closed:
+            _conn_idle_since[id(conn)] = time.time()
+        pool.putconn(conn)
 
 def sha16(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()[:16]
@@ -88,6 +174,28 @@ def init_db():
                 status TEXT NOT NULL
             );
             """)
+            # owed / paid totals and the streak window read only the matching
+            # status rows, straight from the index (replaces ledger_fam_status_kid)
+            cur.execute("""
+            CREATE INDEX IF NOT EXISTS ledger_fam_status_kid_cov
+            ON ledger(family_id, status, kid_name) INCLUDE (reward_cents, ts);
+            """)
+            cur.execute("DROP INDEX IF EXISTS ledger_fam_status_kid;")
+            # pending approvals: only ever a handful of rows
+            cur.execute("""
+            CREATE INDEX IF NOT EXISTS ledger_fam_pending
+            ON ledger(family_id, id DESC) WHERE status='pending';
+            """)
+            # one kid's history, newest first (summary, details, streak)
+            cur.execute("""
+            CREATE INDEX IF NOT EXISTS ledger_fam_kid_id
+            ON ledger(family_id, kid_name, id DESC);
+            """)
+            # streaks walk a kid's activity by time, newest first
+            cur.execute("""
+            CREATE INDEX IF NOT EXISTS ledger_fam_kid_ts
+            ON ledger(family_id, kid_name, ts DESC);
+            """)
 
 def get_or_create_family_id() -> int:
     code_hash = sha16(FAMILY_CODE)
@@ -109,28 +217,81 @@ def seed_default_chores(family_id: int):
     ]
     with db() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) FROM chores WHERE family_id=%s", (family_id,))
-            count = int(cur.fetchone()[0])
-            if count > 0:
+            cur.execute("SELECT 1 FROM chores WHERE family_id=%s LIMIT 1", (family_id,))
+            if cur.fetchone():
                 return
-            for key, title, cents, req in defaults:
-                cur.execute(
-                    "INSERT INTO chores(family_id, chore_key, title, reward_cents, requires_approval) VALUES(%s,%s,%s,%s,%s)",
-                    (family_id, key, title, cents, req),
-                )
+            # one multi-row INSERT instead of a round-trip per chore
+            execute_values(
+                cur,
+                "INSERT INTO chores(family_id, chore_key, title, reward_cents, requires_approval) VALUES %s",
+                [(family_id, key, title, cents, req) for key, title, cents, req in defaults],
+            )
 
+@lru_cache(maxsize=1024)
 def dollars(cents: int) -> str:
-    return f"${cents/100:.2f}"
+    # integer math: no float rounding, no format-spec parsing
+    sign = "-" if cents < 0 else ""
+    cents = abs(int(cents))
+    return f"${sign}{cents // 100}.{cents % 100:02d}"
+
+def add_when(rows: List[dict]) -> List[dict]:
+    # format each row's timestamp once, in server local time like the streaks
+    for r in rows:
+        r["when"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(float(r["ts"])))
+    return rows
+
+def form_text(name: str) -> str:
+    return (request.form.get(name) or "").strip()
+
+def form_cents(name: str) -> int:
+    # werkzeug's type=int falls back to the default on bad input; never negative
+    return max(request.form.get(name, 0, type=int), 0)
 
 
 # ============================================================
 # AUTH (Family code + Parent pin)
 # ============================================================
 
+LOGIN_MAX_FAILS = 5    # wrong codes/PINs allowed per client and form...
+LOGIN_WINDOW = 60      # ...per this many seconds
+_login_fails: Dict[Tuple[str, str], deque] = defaultdict(deque)
+_login_fails_lock = threading.Lock()
+# plain response: a brute-force loop never reaches template rendering
+TOO_MANY_ATTEMPTS = (
+    "Too many attempts. Try again in a minute.",
+    429,
+    {"Content-Type": "text/plain; charset=utf-8"},
+)
+
+def secret_matches(entered: str, secret: str) -> bool:
+    # constant-time compare; an unset secret never matches
+    if not entered or not secret:
+        return False
+    return hmac.compare_digest(entered.encode("utf-8"), secret.encode("utf-8"))
+
+def login_throttled(form: str) -> bool:
+    # form is "family" or "parent": a mistyped PIN never locks out the family code
+    key = (form, request.remote_addr or "")
+    cutoff = time.time() - LOGIN_WINDOW
+    with _login_fails_lock:
+        fails = _login_fails.get(key)
+        if fails is None:
+            return False
+        while fails and fails[0] < cutoff:
+            fails.popleft()
+        if not fails:
+            _login_fails.pop(key, None)
+            return False
+        return len(fails) >= LOGIN_MAX_FAILS
+
+def record_login_failure(form: str):
+    with _login_fails_lock:
+        _login_fails[(form, request.remote_addr or "")].append(time.time())
+
 @app.before_request
 def require_family_login():
     # Allow access to login page and static
-    if request.endpoint in ("family_login", "static", "db_help"):
+    if request.endpoint in ("family_login", "family_login_post", "static", "db_help"):
         return
 
     # If DB is not set, show a setup page for any route
@@ -141,43 +302,35 @@ def require_family_login():
     if not session.get("family_ok"):
         return redirect(url_for("family_login"))
 
-def require_parent():
+@app.before_request
+def require_parent_login():
+    # Every parent_* page needs the Parent PIN, except the PIN form itself
+    endpoint = request.endpoint or ""
+    if not endpoint.startswith("parent_") or endpoint in ("parent_login", "parent_login_post"):
+        return
     if not session.get("parent_ok"):
         return redirect(url_for("parent_login"))
 
 @app.get("/db-help")
 def db_help():
     # Shown if DATABASE_URL is missing
-    page = """
-    <h1>Database not set</h1>
-    <p>This app needs a DATABASE_URL (Postgres) to remember chores on the free plan.</p>
-    <p>In Render: Service → Environment → add <b>DATABASE_URL</b>, then redeploy.</p>
-    """
-    return render_template_string(BASE, title="Setup", body=page)
+    return render_template("db_help.html")
 
 @app.get("/login")
 def family_login():
     # Note: no hints
-    page = """
-    <h1>Family Login</h1>
-    <div class="card">
-      <form method="post" action="{{ url_for('family_login_post') }}">
-        <div class="row">
-          <input name="code" placeholder="Family Code" required />
-          <button class="btn btn-primary" type="submit">Enter</button>
-        </div>
-      </form>
-    </div>
-    """
-    return render_template_string(BASE, title="Login", body=page)
+    return render_template("family_login.html")
 
 @app.post("/login")
 def family_login_post():
-    entered = (request.form.get("code") or "").strip()
+    if login_throttled("family"):
+        return TOO_MANY_ATTEMPTS
+    entered = form_text("code")
 
     # No hints:
-    if not entered or entered != FAMILY_CODE:
+    if not secret_matches(entered, FAMILY_CODE):
         # just reload login silently
+        record_login_failure("family")
         session.clear()
         return redirect(url_for("family_login"))
 
@@ -193,23 +346,15 @@ def logout():
 
 @app.get("/parent/login")
 def parent_login():
-    page = """
-    <h1>Parent Login</h1>
-    <div class="card">
-      <form method="post" action="{{ url_for('parent_login_post') }}">
-        <div class="row">
-          <input name="pin" placeholder="Parent PIN" required />
-          <button class="btn btn-primary" type="submit">Enter</button>
-        </div>
-      </form>
-    </div>
-    """
-    return render_template_string(BASE, title="Parent Login", body=page)
+    return render_template("parent_login.html")
 
 @app.post("/parent/login")
 def parent_login_post():
-    pin = (request.form.get("pin") or "").strip()
-    if not pin or pin != PARENT_PIN:
+    if login_throttled("parent"):
+        return TOO_MANY_ATTEMPTS
+    pin = form_text("pin")
+    if not secret_matches(pin, PARENT_PIN):
+        record_login_failure("parent")
         session["parent_ok"] = False
         return redirect(url_for("parent_login"))
     session["parent_ok"] = True
@@ -223,82 +368,163 @@ def parent_login_post():
 def today_local() -> date:
     return datetime.now().date()
 
-def ledger_rows(family_id: int, kid_name: Optional[str] = None) -> List[dict]:
+def ledger_rows(family_id: int, kid_name: Optional[str] = None, limit: Optional[int] = None) -> List[dict]:
+    # newest first; LIMIT NULL means no limit
     with db() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             if kid_name:
                 cur.execute(
-                    "SELECT * FROM ledger WHERE family_id=%s AND kid_name=%s ORDER BY id DESC",
-                    (family_id, kid_name),
+                    "SELECT id, kid_name, chore_title, reward_cents, ts, status FROM ledger "
+                    "WHERE family_id=%s AND kid_name=%s ORDER BY id DESC LIMIT %s",
+                    (family_id, kid_name, limit),
                 )
             else:
-                cur.execute("SELECT * FROM ledger WHERE family_id=%s ORDER BY id DESC", (family_id,))
+                cur.execute(
+                    "SELECT id, kid_name, chore_title, reward_cents, ts, status FROM ledger "
+                    "WHERE family_id=%s ORDER BY id DESC LIMIT %s",
+                    (family_id, limit),
+                )
             return list(cur.fetchall())
 
 def chores_rows(family_id: int) -> List[dict]:
     with db() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("SELECT * FROM chores WHERE family_id=%s ORDER BY title ASC", (family_id,))
+            cur.execute(
+                "SELECT chore_key, title, reward_cents, requires_approval FROM chores "
+                "WHERE family_id=%s ORDER BY title ASC",
+                (family_id,),
+            )
             return list(cur.fetchall())
 
 def kids_rows(family_id: int) -> List[dict]:
     with db() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("SELECT * FROM kids WHERE family_id=%s ORDER BY name ASC", (family_id,))
+            cur.execute("SELECT name, goal_cents FROM kids WHERE family_id=%s ORDER BY name ASC", (family_id,))
             return list(cur.fetchall())
 
-def owed_by_kid(family_id: int) -> Dict[str, int]:
+def kid_row(family_id: int, kid_name: str) -> Optional[dict]:
     with db() as conn:
-        with conn.cursor() as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("SELECT name, goal_cents FROM kids WHERE family_id=%s AND name=%s", (family_id, kid_name))
+            return cur.fetchone()
+
+STREAK_WINDOW_DAYS = 31  # days of activity the dashboard reads in bulk for streaks
+PENDING_LIMIT = 200      # newest pending approvals shown on the dashboard
+
+def streak_window_start() -> float:
+    # local midnight at the start of the bulk streak window
+    start = today_local() - timedelta(days=STREAK_WINDOW_DAYS - 1)
+    return time.mktime(start.timetuple())
+
+def streak_from_timestamps(timestamps: List[float]) -> int:
+    days = {datetime.fromtimestamp(float(ts)).date() for ts in timestamps}
+    streak = 0
+    d = today_local()
+    while d in days:
+        streak += 1
+        d = d - timedelta(days=1)
+    return streak
+
+def dashboard_rollup(family_id: int) -> List[dict]:
+    # every kid with goal, owed, paid, chores logged and streak, in one round-trip
+    with db() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("""
-                SELECT kid_name, COALESCE(SUM(reward_cents),0)
-                FROM ledger
-                WHERE family_id=%s AND status='approved'
-                GROUP BY kid_name
-            """, (family_id,))
-            out = {}
-            for kid, total in cur.fetchall():
-                out[str(kid)] = int(total)
-            return out
-
-def totals_by_kid(family_id: int) -> Dict[str, int]:
-    # total chores logged (pending + approved + paid)
+                WITH agg AS (
+                    SELECT
+                        kid_name,
+                        SUM(reward_cents) FILTER (WHERE status='approved') AS owed,
+                        SUM(reward_cents) FILTER (WHERE status='paid') AS paid,
+                        COUNT(*) FILTER (WHERE status IN ('pending','approved','paid')) AS total
+                    FROM ledger
+                    WHERE family_id=%(family_id)s
+                    GROUP BY kid_name
+                ),
+                recent AS (
+                    SELECT kid_name, array_agg(ts) AS recent_ts
+                    FROM ledger
+                    WHERE family_id=%(family_id)s
+                      AND status IN ('pending','approved','paid')
+                      AND ts >= %(since)s
+                    GROUP BY kid_name
+                )
+                SELECT
+                    k.name,
+                    k.goal_cents,
+                    COALESCE(a.owed,0) AS owed,
+                    COALESCE(a.paid,0) AS paid,
+                    COALESCE(a.total,0) AS total,
+                    COALESCE(r.recent_ts, '{}') AS recent_ts
+                FROM kids k
+                LEFT JOIN agg a ON a.kid_name=k.name
+                LEFT JOIN recent r ON r.kid_name=k.name
+                WHERE k.family_id=%(family_id)s
+                ORDER BY k.name ASC
+            """, {"family_id": family_id, "since": streak_window_start()})
+            kids = list(cur.fetchall())
+
+    for k in kids:
+        streak = streak_from_timestamps(k.pop("recent_ts"))
+        if streak >= STREAK_WINDOW_DAYS:
+            # runs past the bulk window: walk this kid's full history
+            streak = streak_full_walk(family_id, k["name"])
+        k["streak"] = streak
+    return kids
+
+def kid_totals(family_id: int, kid_name: str) -> Tuple[int, int, int]:
+    # (owed, paid total, chores logged) for one kid in a single pass
     with db() as conn:
         with conn.cursor() as cur:
             cur.execute("""
-                SELECT kid_name, COUNT(*)
+                SELECT
+                    COALESCE(SUM(reward_cents) FILTER (WHERE status='approved'),0),
+                    COALESCE(SUM(reward_cents) FILTER (WHERE status='paid'),0),
+                    COUNT(*) FILTER (WHERE status IN ('pending','approved','paid'))
                 FROM ledger
-                WHERE family_id=%s AND status IN ('pending','approved','paid')
-                GROUP BY kid_name
-            """, (family_id,))
-            return {str(k): int(c) for k, c in cur.fetchall()}
+                WHERE family_id=%s AND kid_name=%s
+            """, (family_id, kid_name))
+            owed, paid, total = cur.fetchone()
+            return int(owed), int(paid), int(total)
 
-def paid_total_by_kid(family_id: int) -> Dict[str, int]:
+def streak_for_kid(family_id: int, kid_name: str) -> int:
+    # streak = consecutive days (ending today) where kid logged at least one chore
+    # Same as the dashboard: one round-trip over the recent window, and the
+    # full walk only when the streak fills it.
     with db() as conn:
         with conn.cursor() as cur:
             cur.execute("""
-                SELECT kid_name, COALESCE(SUM(reward_cents),0)
+                SELECT ts
                 FROM ledger
-                WHERE family_id=%s AND status='paid'
-                GROUP BY kid_name
-            """, (family_id,))
-            return {str(k): int(s) for k, s in cur.fetchall()}
-
-def streak_for_kid(family_id: int, kid_name: str) -> int:
-    # streak = consecutive days (ending today) where kid logged at least one chore
-    rows = ledger_rows(family_id, kid_name)
-    days = set()
-    for r in rows:
-        ts = float(r["ts"])
-        d = datetime.fromtimestamp(ts).date()
-        if r["status"] in ("pending", "approved", "paid"):
-            days.add(d)
+                WHERE family_id=%s AND kid_name=%s AND status IN ('pending','approved','paid')
+                  AND ts >= %s
+            """, (family_id, kid_name, streak_window_start()))
+            streak = streak_from_timestamps([ts for (ts,) in cur.fetchall()])
+    if streak >= STREAK_WINDOW_DAYS:
+        streak = streak_full_walk(family_id, kid_name)
+    return streak
 
+def streak_full_walk(family_id: int, kid_name: str) -> int:
+    # Walk the kid's activity newest-first through a server-side cursor and stop
+    # at the first gap: only rows inside the current streak leave the database.
     streak = 0
-    d = today_local()
-    while d in days:
-        streak += 1
-        d = d - timedelta(days=1)
+    expected = today_local()
+    with db() as conn:
+        with conn.cursor(name="streak_ts") as cur:
+            cur.itersize = 64
+            cur.execute("""
+                SELECT ts
+                FROM ledger
+                WHERE family_id=%s AND kid_name=%s AND status IN ('pending','approved','paid')
+                ORDER BY ts DESC
+            """, (family_id, kid_name))
+            for (ts,) in cur:
+                d = datetime.fromtimestamp(float(ts)).date()
+                if d == expected:
+                    streak += 1
+                    expected = expected - timedelta(days=1)
+                elif d < expected:
+                    break
+                # d > expected: a day already counted (or a future timestamp)
     return streak
 
 
@@ -306,11 +532,17 @@ def streak_for_kid(family_id: int, kid_name: str) -> int:
 # CORE ACTIONS
 # ============================================================
 
+_family_id: Optional[int] = None  # FAMILY_CODE is fixed, so the family row is too
+
 def ensure_family_ready() -> int:
-    init_db()
-    family_id = get_or_create_family_id()
-    seed_default_chores(family_id)
-    return family_id
+    global _family_id
+    if _family_id is None:
+        # schema and family row only need checking once per process
+        init_db()
+        _family_id = get_or_create_family_id()
+    # still cheap and per request: defaults come back if every chore is deleted
+    seed_default_chores(_family_id)
+    return _family_id
 
 def add_kid_db(family_id: int, name: str):
     name = name.strip()
@@ -353,30 +585,24 @@ def delete_chore_db(family_id: int, key: str):
             cur.execute("DELETE FROM chores WHERE family_id=%s AND chore_key=%s", (family_id, key))
 
 def submit_chore_db(family_id: int, kid_name: str, chore_key: str):
+    # copy title/reward from the chore in one statement; unknown chore -> no row
     with db() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                "SELECT * FROM chores WHERE family_id=%s AND chore_key=%s",
-                (family_id, chore_key),
-            )
-            chore = cur.fetchone()
-            if not chore:
-                return
-            status = "pending" if bool(chore["requires_approval"]) else "approved"
+        with conn.cursor() as cur:
             cur.execute("""
                 INSERT INTO ledger(family_id, kid_name, chore_key, chore_title, reward_cents, ts, status)
-                VALUES(%s,%s,%s,%s,%s,%s,%s)
-            """, (
-                family_id,
-                kid_name,
-                chore_key,
-                chore["title"],
-                int(chore["reward_cents"]),
-                time.time(),
-                status
-            ))
+                SELECT family_id, %s, chore_key, title, reward_cents, %s,
+                       CASE WHEN requires_approval THEN 'pending' ELSE 'approved' END
+                FROM chores
+                WHERE family_id=%s AND chore_key=%s
+            """, (kid_name, time.time(), family_id, chore_key))
 
 def approve_deny_db(family_id: int, ledger_id: int, approve: bool):
+    approve_deny_many_db(family_id, [ledger_id], approve)
+
+def approve_deny_many_db(family_id: int, ledger_ids: List[int], approve: bool) -> int:
+    # one UPDATE for any number of entries; returns how many changed
+    if not ledger_ids:
+        return 0
     new_status = "approved" if approve else "denied"
     with db() as conn:
         with conn.cursor() as cur:
@@ -384,10 +610,12 @@ def approve_deny_db(family_id: int, ledger_id: int, approve: bool):
             cur.execute("""
                 UPDATE ledger
                 SET status=%s
-                WHERE family_id=%s AND id=%s AND status='pending'
-            """, (new_status, family_id, ledger_id))
+                WHERE family_id=%s AND id = ANY(%s::int[]) AND status='pending'
+            """, (new_status, family_id, ledger_ids))
+            return cur.rowcount
 
-def mark_paid_db(family_id: int, kid_name: str):
+def mark_paid_db(family_id: int, kid_name: str) -> int:
+    # one indexed UPDATE; returns how many chores were marked paid
     with db() as conn:
         with conn.cursor() as cur:
             cur.execute("""
@@ -395,6 +623,7 @@ def mark_paid_db(family_id: int, kid_name: str):
                 SET status='paid'
                 WHERE family_id=%s AND kid_name=%s AND status='approved'
             """, (family_id, kid_name))
+            return cur.rowcount
 
 
 # ============================================================
@@ -407,21 +636,8 @@ BASE = """
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{{ title }}</title>
-  <style>
-    body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial; margin: 18px; max-width: 980px; }
-    a { color: #111; }
-    .top a { margin-right: 12px; }
-    .card { border: 1px solid #e6e6e6; border-radius: 14px; padding: 14px; margin: 14px 0; }
-    .row { display:flex; gap: 10px; flex-wrap: wrap; align-items: center; }
-    .btn { display:inline-block; padding: 10px 12px; border-radius: 12px; border: 1px solid #ccc; background: #fafafa; text-decoration: none; color: #111; cursor:pointer; }
-    .btn-primary { background:#111; color:#fff; border-color:#111; }
-    .btn-danger { background:#fff5f5; border-color:#ffcccc; }
-    table { width:100%; border-collapse: collapse; }
-    th, td { padding: 8px; border-bottom: 1px solid #eee; text-align:left; vertical-align: top; }
-    input, select { padding: 9px; border-radius: 12px; border: 1px solid #ccc; }
-    small { color:#666; }
-  </style>
+  <title>{% block title %}{% endblock %}</title>
+  <link rel="stylesheet" href="{{ url_for('static', filename='app.css', v=css_version) }}" />
 </head>
 <body>
   <div class="top">
@@ -431,11 +647,378 @@ BASE = """
     <a href="{{ url_for('logout') }}">Logout</a>
   </div>
   <hr />
-  {{ body|safe }}
+  {% for message in get_flashed_messages() %}
+    <div class="card"><small>{{ message }}</small></div>
+  {% endfor %}
+  {% block body %}{% endblock %}
 </body>
 </html>
 """
 
+DB_HELP = """{% extends "base.html" %}
+{% block title %}Setup{% endblock %}
+{% block body %}
+<h1>Database not set</h1>
+<p>This app needs a DATABASE_URL (Postgres) to remember chores on the free plan.</p>
+<p>In Render: Service → Environment → add <b>DATABASE_URL</b>, then redeploy.</p>
+{% endblock %}
+"""
+
+FAMILY_LOGIN = """{% extends "base.html" %}
+{% block title %}Login{% endblock %}
+{% block body %}
+<h1>Family Login</h1>
+<div class="card">
+  <form method="post" action="{{ url_for('family_login_post') }}">
+    <div class="row">
+      <input name="code" placeholder="Family Code" required />
+      <button class="btn btn-primary" type="submit">Enter</button>
+    </div>
+  </form>
+</div>
+{% endblock %}
+"""
+
+PARENT_LOGIN = """{% extends "base.html" %}
+{% block title %}Parent Login{% endblock %}
+{% block body %}
+<h1>Parent Login</h1>
+<div class="card">
+  <form method="post" action="{{ url_for('parent_login_post') }}">
+    <div class="row">
+      <input name="pin" placeholder="Parent PIN" required />
+      <button class="btn btn-primary" type="submit">Enter</button>
+    </div>
+  </form>
+</div>
+{% endblock %}
+"""
+
+HOME = """{% extends "base.html" %}
+{% block title %}Home{% endblock %}
+{% block body %}
+<h1>{{ app_name }}</h1>
+
+<div class="card">
+  <h2>Main Menu</h2>
+  <div class="row">
+    <a class="btn btn-primary" href="{{ url_for('kid_menu') }}">Kid Menu</a>
+    <a class="btn btn-primary" href="{{ url_for('parent_dashboard') }}">Parent Dashboard</a>
+  </div>
+  <p><small>Tip: Parent pages need the Parent PIN.</small></p>
+</div>
+{% endblock %}
+"""
+
+KID_MENU = """{% extends "base.html" %}
+{% block title %}Kid{% endblock %}
+{% block body %}
+<h1>Kid Menu</h1>
+
+<div class="card">
+  <h2>Log a chore</h2>
+  {% if kids|length == 0 %}
+    <p>No kids yet. Ask a parent to add you in Parent Dashboard.</p>
+  {% else %}
+    <form method="post" action="{{ url_for('kid_log') }}">
+      <div class="row">
+        <select name="kid_name" required>
+          {% for k in kids %}
+            <option value="{{ k['name'] }}">{{ k['name'] }}</option>
+          {% endfor %}
+        </select>
+
+        <select name="chore_key" required>
+          {% for c in chores %}
+            <option value="{{ c['chore_key'] }}">
+              {{ c['title'] }} ({{ dollars(c['reward_cents']) }})
+              {% if c['requires_approval'] %} [needs approval]{% else %} [auto]{% endif %}
+            </option>
+          {% endfor %}
+        </select>
+
+        <button class="btn btn-primary" type="submit">Log Chore</button>
+      </div>
+    </form>
+  {% endif %}
+</div>
+
+<div class="card">
+  <h2>Kid Summary</h2>
+  {% if kids|length == 0 %}
+    <p>No kids yet.</p>
+  {% else %}
+    <form method="get" action="{{ url_for('kid_summary') }}">
+      <div class="row">
+        <select name="kid_name" required>
+          {% for k in kids %}
+            <option value="{{ k['name'] }}">{{ k['name'] }}</option>
+          {% endfor %}
+        </select>
+        <button class="btn" type="submit">View</button>
+      </div>
+    </form>
+  {% endif %}
+</div>
+{% endblock %}
+"""
+
+KID_SUMMARY = """{% extends "base.html" %}
+{% block title %}Kid Summary{% endblock %}
+{% block body %}
+<h1>Kid Summary: {{ kid_name }}</h1>
+
+<div class="card">
+  <div class="row">
+    <div><b>Owed (approved, unpaid):</b> {{ dollars(owed) }}</div>
+    <div><b>Paid total:</b> {{ dollars(paid_total) }}</div>
+    <div><b>Total chores:</b> {{ total_done }}</div>
+    <div><b>Streak:</b> {{ streak }} day(s)</div>
+  </div>
+</div>
+
+<div class="card">
+  <h2>Goal</h2>
+  <p><b>Goal:</b> {{ dollars(goal) }}</p>
+  <p><b>Earned (paid + owed):</b> {{ dollars(progress) }}</p>
+  <p><b>Remaining:</b> {{ dollars(remaining) }}</p>
+</div>
+
+<div class="card">
+  <h2>Recent chores</h2>
+  {% if rows|length == 0 %}
+    <p>No chores yet.</p>
+  {% else %}
+    <table>
+      <tr><th>When</th><th>Chore</th><th>Amount</th><th>Status</th></tr>
+      {% for r in rows %}
+        <tr>
+          <td>{{ r['when'] }}</td>
+          <td>{{ r['chore_title'] }}</td>
+          <td>{{ dollars(r['reward_cents']) }}</td>
+          <td>{{ r['status'] }}</td>
+        </tr>
+      {% endfor %}
+    </table>
+  {% endif %}
+</div>
+
+<div class="card">
+  <a class="btn" href="{{ url_for('kid_menu') }}">Back to Kid Menu</a>
+</div>
+{% endblock %}
+"""
+
+PARENT_DASHBOARD = """{% extends "base.html" %}
+{% block title %}Parent{% endblock %}
+{% block body %}
+<h1>Parent Dashboard</h1>
+
+<div class="card">
+  <h2>Add a kid</h2>
+  <form method="post" action="{{ url_for('parent_add_kid') }}">
+    <div class="row">
+      <input name="kid_name" placeholder="Kid name" required />
+      <button class="btn btn-primary" type="submit">Add</button>
+    </div>
+  </form>
+</div>
+
+<div class="card">
+  <h2>Kids (owed + streaks + goals)</h2>
+  {% if kids|length == 0 %}
+    <p>No kids yet.</p>
+  {% else %}
+    <table>
+      <tr>
+        <th>Kid</th>
+        <th>Total chores</th>
+        <th>Streak</th>
+        <th>Owed</th>
+        <th>Paid total</th>
+        <th>Goal</th>
+        <th>Set goal</th>
+        <th>Pay</th>
+        <th>Details</th>
+      </tr>
+      {% for k in kids %}
+        {% set name = k['name'] %}
+        <tr>
+          <td><b>{{ name }}</b></td>
+          <td>{{ k['total'] }}</td>
+          <td>{{ k['streak'] }} day(s)</td>
+          <td><b>{{ dollars(k['owed']) }}</b></td>
+          <td>{{ dollars(k['paid']) }}</td>
+          <td>{{ dollars(k['goal_cents']) }}</td>
+          <td>
+            <form method="post" action="{{ url_for('parent_set_goal') }}">
+              <input type="hidden" name="kid_name" value="{{ name }}" />
+              <input name="goal_cents" placeholder="cents" style="width:90px;" required />
+              <button class="btn" type="submit">Set</button>
+            </form>
+          </td>
+          <td>
+            <form method="post" action="{{ url_for('parent_pay_kid') }}">
+              <input type="hidden" name="kid_name" value="{{ name }}" />
+              <button class="btn" type="submit">Mark paid</button>
+            </form>
+          </td>
+          <td>
+            <a class="btn" href="{{ url_for('parent_kid_details', kid_name=name) }}">See chores</a>
+          </td>
+        </tr>
+      {% endfor %}
+    </table>
+    <p><small>“Owed” = approved chores not marked paid yet.</small></p>
+  {% endif %}
+</div>
+
+<div class="card">
+  <h2>Pending approvals</h2>
+  {% if pending|length == 0 %}
+    <p>No pending chores.</p>
+  {% else %}
+    <table>
+      <tr><th>Kid</th><th>Chore</th><th>Amount</th><th>Action</th></tr>
+      {% for r in pending %}
+        <tr>
+          <td>{{ r['kid_name'] }}</td>
+          <td>{{ r['chore_title'] }}</td>
+          <td>{{ dollars(r['reward_cents']) }}</td>
+          <td class="row">
+            <form method="post" action="{{ url_for('parent_approve') }}">
+              <input type="hidden" name="ledger_id" value="{{ r['id'] }}" />
+              <input type="hidden" name="approve" value="1" />
+              <button class="btn btn-primary" type="submit">Approve</button>
+            </form>
+            <form method="post" action="{{ url_for('parent_approve') }}">
+              <input type="hidden" name="ledger_id" value="{{ r['id'] }}" />
+              <input type="hidden" name="approve" value="0" />
+              <button class="btn btn-danger" type="submit">Deny</button>
+            </form>
+          </td>
+        </tr>
+      {% endfor %}
+    </table>
+    <form method="post" action="{{ url_for('parent_approve_all') }}">
+      {% for r in pending %}
+        <input type="hidden" name="ledger_id" value="{{ r['id'] }}" />
+      {% endfor %}
+      <button class="btn btn-primary" type="submit">Approve all</button>
+    </form>
+    {% if truncated %}
+      <p><small>Showing the newest {{ pending_limit }}. Approve some to see older ones.</small></p>
+    {% endif %}
+  {% endif %}
+</div>
+
+<div class="card">
+  <h2>Edit chores & payouts</h2>
+  <a class="btn btn-primary" href="{{ url_for('parent_edit_chores') }}">Edit chores</a>
+</div>
+{% endblock %}
+"""
+
+KID_DETAILS = """{% extends "base.html" %}
+{% block title %}Kid Details{% endblock %}
+{% block body %}
+<h1>Chores for {{ kid_name }}</h1>
+
+<div class="card">
+  {% if rows|length == 0 %}
+    <p>No chores yet.</p>
+  {% else %}
+    <table>
+      <tr><th>When</th><th>Chore</th><th>Amount</th><th>Status</th></tr>
+      {% for r in rows %}
+        <tr>
+          <td>{{ r['when'] }}</td>
+          <td>{{ r['chore_title'] }}</td>
+          <td>{{ dollars(r['reward_cents']) }}</td>
+          <td>{{ r['status'] }}</td>
+        </tr>
+      {% endfor %}
+    </table>
+  {% endif %}
+</div>
+
+<div class="card">
+  <a class="btn" href="{{ url_for('parent_dashboard') }}">Back to Parent</a>
+</div>
+{% endblock %}
+"""
+
+EDIT_CHORES = """{% extends "base.html" %}
+{% block title %}Edit Chores{% endblock %}
+{% block body %}
+<h1>Edit Chores</h1>
+
+<div class="card">
+  <h2>Add / Update</h2>
+  <form method="post" action="{{ url_for('parent_save_chore') }}">
+    <div class="row">
+      <input name="chore_key" placeholder="id (example: vacuum)" required />
+      <input name="title" placeholder="title kids see" required />
+      <input name="reward_cents" placeholder="cents (example: 75)" required />
+      <select name="requires_approval">
+        <option value="1">Needs approval</option>
+        <option value="0">Auto-approved</option>
+      </select>
+      <button class="btn btn-primary" type="submit">Save</button>
+    </div>
+  </form>
+  <p><small>100 cents = $1.00</small></p>
+</div>
+
+<div class="card">
+  <h2>Current chores</h2>
+  {% if chores|length == 0 %}
+    <p>No chores.</p>
+  {% else %}
+    <table>
+      <tr><th>ID</th><th>Title</th><th>Payout</th><th>Approval</th><th>Delete</th></tr>
+      {% for c in chores %}
+        <tr>
+          <td>{{ c['chore_key'] }}</td>
+          <td>{{ c['title'] }}</td>
+          <td>{{ dollars(c['reward_cents']) }}</td>
+          <td>{% if c['requires_approval'] %}needs approval{% else %}auto{% endif %}</td>
+          <td>
+            <form method="post" action="{{ url_for('parent_delete_chore') }}">
+              <input type="hidden" name="chore_key" value="{{ c['chore_key'] }}" />
+              <button class="btn btn-danger" type="submit">Delete</button>
+            </form>
+          </td>
+        </tr>
+      {% endfor %}
+    </table>
+  {% endif %}
+</div>
+
+<div class="card">
+  <a class="btn" href="{{ url_for('parent_dashboard') }}">Back to Parent</a>
+</div>
+{% endblock %}
+"""
+
+# Changes whenever static/app.css changes, so the long cache never serves stale CSS.
+with open(os.path.join(app.static_folder, "app.css"), encoding="utf-8") as f:
+    app.jinja_env.globals["css_version"] = sha16(f.read())
+
+# Named templates: Jinja compiles each once and caches it by name.
+app.jinja_loader = DictLoader({
+    "base.html": BASE,
+    "db_help.html": DB_HELP,
+    "family_login.html": FAMILY_LOGIN,
+    "parent_login.html": PARENT_LOGIN,
+    "home.html": HOME,
+    "kid_menu.html": KID_MENU,
+    "kid_summary.html": KID_SUMMARY,
+    "parent_dashboard.html": PARENT_DASHBOARD,
+    "kid_details.html": KID_DETAILS,
+    "edit_chores.html": EDIT_CHORES,
+})
+
 
 # ============================================================
 # ROUTES
@@ -444,83 +1027,20 @@ BASE = """
 @app.get("/")
 def home():
     family_id = ensure_family_ready()
-    page = """
-    <h1>{{ app_name }}</h1>
-
-    <div class="card">
-      <h2>Main Menu</h2>
-      <div class="row">
-        <a class="btn btn-primary" href="{{ url_for('kid_menu') }}">Kid Menu</a>
-        <a class="btn btn-primary" href="{{ url_for('parent_dashboard') }}">Parent Dashboard</a>
-      </div>
-      <p><small>Tip: Parent pages need the Parent PIN.</small></p>
-    </div>
-    """
-    return render_template_string(BASE, title="Home", body=render_template_string(page, app_name=APP_NAME))
+    return render_template("home.html", app_name=APP_NAME)
 
 @app.get("/kid")
 def kid_menu():
     family_id = ensure_family_ready()
     kids = kids_rows(family_id)
     chores = chores_rows(family_id)
-
-    page = """
-    <h1>Kid Menu</h1>
-
-    <div class="card">
-      <h2>Log a chore</h2>
-      {% if kids|length == 0 %}
-        <p>No kids yet. Ask a parent to add you in Parent Dashboard.</p>
-      {% else %}
-        <form method="post" action="{{ url_for('kid_log') }}">
-          <div class="row">
-            <select name="kid_name" required>
-              {% for k in kids %}
-                <option value="{{ k['name'] }}">{{ k['name'] }}</option>
-              {% endfor %}
-            </select>
-
-            <select name="chore_key" required>
-              {% for c in chores %}
-                <option value="{{ c['chore_key'] }}">
-                  {{ c['title'] }} ({{ dollars(c['reward_cents']) }})
-                  {% if c['requires_approval'] %} [needs approval]{% else %} [auto]{% endif %}
-                </option>
-              {% endfor %}
-            </select>
-
-            <button class="btn btn-primary" type="submit">Log Chore</button>
-          </div>
-        </form>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <h2>Kid Summary</h2>
-      {% if kids|length == 0 %}
-        <p>No kids yet.</p>
-      {% else %}
-        <form method="get" action="{{ url_for('kid_summary') }}">
-          <div class="row">
-            <select name="kid_name" required>
-              {% for k in kids %}
-                <option value="{{ k['name'] }}">{{ k['name'] }}</option>
-              {% endfor %}
-            </select>
-            <button class="btn" type="submit">View</button>
-          </div>
-        </form>
-      {% endif %}
-    </div>
-    """
-    body = render_template_string(page, kids=kids, chores=chores, dollars=dollars)
-    return render_template_string(BASE, title="Kid", body=body)
+    return render_template("kid_menu.html", kids=kids, chores=chores, dollars=dollars)
 
 @app.post("/kid/log")
 def kid_log():
     family_id = ensure_family_ready()
-    kid_name = (request.form.get("kid_name") or "").strip()
-    chore_key = (request.form.get("chore_key") or "").strip()
+    kid_name = form_text("kid_name")
+    chore_key = form_text("chore_key")
     if kid_name and chore_key:
         submit_chore_db(family_id, kid_name, chore_key)
     return redirect(url_for("kid_menu"))
@@ -532,69 +1052,21 @@ def kid_summary():
     if not kid_name:
         return redirect(url_for("kid_menu"))
 
-    kids = kids_rows(family_id)
-    kid = next((k for k in kids if k["name"] == kid_name), None)
+    kid = kid_row(family_id, kid_name)
     if not kid:
         return redirect(url_for("kid_menu"))
 
-    owed = owed_by_kid(family_id).get(kid_name, 0)
-    paid_total = paid_total_by_kid(family_id).get(kid_name, 0)
-    total_done = totals_by_kid(family_id).get(kid_name, 0)
+    owed, paid_total, total_done = kid_totals(family_id, kid_name)
     streak = streak_for_kid(family_id, kid_name)
 
-    rows = ledger_rows(family_id, kid_name)[:50]
+    rows = add_when(ledger_rows(family_id, kid_name, limit=50))
 
     goal = int(kid["goal_cents"])
     progress = paid_total + owed  # what you've earned (paid + waiting)
     remaining = max(goal - progress, 0)
 
-    page = """
-    <h1>Kid Summary: {{ kid_name }}</h1>
-
-    <div class="card">
-      <div class="row">
-        <div><b>Owed (approved, unpaid):</b> {{ dollars(owed) }}</div>
-        <div><b>Paid total:</b> {{ dollars(paid_total) }}</div>
-        <div><b>Total chores:</b> {{ total_done }}</div>
-        <div><b>Streak:</b> {{ streak }} day(s)</div>
-      </div>
-    </div>
-
-    <div class="card">
-      <h2>Goal</h2>
-      <p><b>Goal:</b> {{ dollars(goal) }}</p>
-      <p><b>Earned (paid + owed):</b> {{ dollars(progress) }}</p>
-      <p><b>Remaining:</b> {{ dollars(remaining) }}</p>
-    </div>
-
-    <div class="card">
-      <h2>Recent chores</h2>
-      {% if rows|length == 0 %}
-        <p>No chores yet.</p>
-      {% else %}
-        <table>
-          <tr><th>When</th><th>Chore</th><th>Amount</th><th>Status</th></tr>
-          {% for r in rows %}
-            <tr>
-              <td>{{ dt(r['ts']) }}</td>
-              <td>{{ r['chore_title'] }}</td>
-              <td>{{ dollars(r['reward_cents']) }}</td>
-              <td>{{ r['status'] }}</td>
-            </tr>
-          {% endfor %}
-        </table>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <a class="btn" href="{{ url_for('kid_menu') }}">Back to Kid Menu</a>
-    </div>
-    """
-    def dt(ts: float) -> str:
-        return datetime.fromtimestamp(float(ts)).strftime("%Y-%m-%d %H:%M")
-
-    body = render_template_string(
-        page,
+    return render_template(
+        "kid_summary.html",
         kid_name=kid_name,
         owed=owed,
         paid_total=paid_total,
@@ -602,314 +1074,112 @@ def kid_summary():
         streak=streak,
         rows=rows,
         dollars=dollars,
-        dt=dt,
         goal=goal,
         progress=progress,
         remaining=remaining,
     )
-    return render_template_string(BASE, title="Kid Summary", body=body)
 
 @app.get("/parent")
 def parent_dashboard():
-    require_parent()
     family_id = ensure_family_ready()
 
-    kids = kids_rows(family_id)
-    chores = chores_rows(family_id)
-    owed = owed_by_kid(family_id)
-    totals = totals_by_kid(family_id)
-    paid_totals = paid_total_by_kid(family_id)
+    kids = dashboard_rollup(family_id)
 
     # pending list
     with db() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("""
-                SELECT * FROM ledger
+                SELECT id, kid_name, chore_title, reward_cents FROM ledger
                 WHERE family_id=%s AND status='pending'
                 ORDER BY id DESC
-            """, (family_id,))
-            pending = list(cur.fetchall())
-
-    page = """
-    <h1>Parent Dashboard</h1>
-
-    <div class="card">
-      <h2>Add a kid</h2>
-      <form method="post" action="{{ url_for('parent_add_kid') }}">
-        <div class="row">
-          <input name="kid_name" placeholder="Kid name" required />
-          <button class="btn btn-primary" type="submit">Add</button>
-        </div>
-      </form>
-    </div>
-
-    <div class="card">
-      <h2>Kids (owed + streaks + goals)</h2>
-      {% if kids|length == 0 %}
-        <p>No kids yet.</p>
-      {% else %}
-        <table>
-          <tr>
-            <th>Kid</th>
-            <th>Total chores</th>
-            <th>Streak</th>
-            <th>Owed</th>
-            <th>Paid total</th>
-            <th>Goal</th>
-            <th>Set goal</th>
-            <th>Pay</th>
-            <th>Details</th>
-          </tr>
-          {% for k in kids %}
-            {% set name = k['name'] %}
-            <tr>
-              <td><b>{{ name }}</b></td>
-              <td>{{ totals.get(name, 0) }}</td>
-              <td>{{ streak(name) }} day(s)</td>
-              <td><b>{{ dollars(owed.get(name, 0)) }}</b></td>
-              <td>{{ dollars(paid_totals.get(name, 0)) }}</td>
-              <td>{{ dollars(k['goal_cents']) }}</td>
-              <td>
-                <form method="post" action="{{ url_for('parent_set_goal') }}">
-                  <input type="hidden" name="kid_name" value="{{ name }}" />
-                  <input name="goal_cents" placeholder="cents" style="width:90px;" required />
-                  <button class="btn" type="submit">Set</button>
-                </form>
-              </td>
-              <td>
-                <form method="post" action="{{ url_for('parent_pay_kid') }}">
-                  <input type="hidden" name="kid_name" value="{{ name }}" />
-                  <button class="btn" type="submit">Mark paid</button>
-                </form>
-              </td>
-              <td>
-                <a class="btn" href="{{ url_for('parent_kid_details', kid_name=name) }}">See chores</a>
-              </td>
-            </tr>
-          {% endfor %}
-        </table>
-        <p><small>“Owed” = approved chores not marked paid yet.</small></p>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <h2>Pending approvals</h2>
-      {% if pending|length == 0 %}
-        <p>No pending chores.</p>
-      {% else %}
-        <table>
-          <tr><th>Kid</th><th>Chore</th><th>Amount</th><th>Action</th></tr>
-          {% for r in pending %}
-            <tr>
-              <td>{{ r['kid_name'] }}</td>
-              <td>{{ r['chore_title'] }}</td>
-              <td>{{ dollars(r['reward_cents']) }}</td>
-              <td class="row">
-                <form method="post" action="{{ url_for('parent_approve') }}">
-                  <input type="hidden" name="ledger_id" value="{{ r['id'] }}" />
-                  <input type="hidden" name="approve" value="1" />
-                  <button class="btn btn-primary" type="submit">Approve</button>
-                </form>
-                <form method="post" action="{{ url_for('parent_approve') }}">
-                  <input type="hidden" name="ledger_id" value="{{ r['id'] }}" />
-                  <input type="hidden" name="approve" value="0" />
-                  <button class="btn btn-danger" type="submit">Deny</button>
-                </form>
-              </td>
-            </tr>
-          {% endfor %}
-        </table>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <h2>Edit chores & payouts</h2>
-      <a class="btn btn-primary" href="{{ url_for('parent_edit_chores') }}">Edit chores</a>
-    </div>
-    """
-
-    def streak(name: str) -> int:
-        return streak_for_kid(family_id, name)
-
-    body = render_template_string(
-        page,
+                LIMIT %s
+            """, (family_id, PENDING_LIMIT + 1))
+            pending = cur.fetchall()
+    # the extra row only tells us whether older ones were cut off
+    truncated = len(pending) > PENDING_LIMIT
+    pending = pending[:PENDING_LIMIT]
+
+    return render_template(
+        "parent_dashboard.html",
         kids=kids,
-        chores=chores,
-        owed=owed,
-        totals=totals,
-        paid_totals=paid_totals,
         pending=pending,
+        pending_limit=PENDING_LIMIT,
+        truncated=truncated,
         dollars=dollars,
-        streak=streak,
     )
-    return render_template_string(BASE, title="Parent", body=body)
 
 @app.post("/parent/add_kid")
 def parent_add_kid():
-    require_parent()
     family_id = ensure_family_ready()
-    name = (request.form.get("kid_name") or "").strip()
+    name = form_text("kid_name")
     add_kid_db(family_id, name)
     return redirect(url_for("parent_dashboard"))
 
 @app.post("/parent/set_goal")
 def parent_set_goal():
-    require_parent()
     family_id = ensure_family_ready()
-    kid_name = (request.form.get("kid_name") or "").strip()
-    raw = (request.form.get("goal_cents") or "").strip()
-    try:
-        goal_cents = int(raw)
-    except ValueError:
-        goal_cents = 0
-    if goal_cents < 0:
-        goal_cents = 0
+    kid_name = form_text("kid_name")
+    goal_cents = form_cents("goal_cents")
     set_goal_db(family_id, kid_name, goal_cents)
     return redirect(url_for("parent_dashboard"))
 
 @app.post("/parent/pay")
 def parent_pay_kid():
-    require_parent()
     family_id = ensure_family_ready()
-    kid_name = (request.form.get("kid_name") or "").strip()
-    mark_paid_db(family_id, kid_name)
+    kid_name = form_text("kid_name")
+    paid = mark_paid_db(family_id, kid_name)
+    flash(f"Marked {paid} chore(s) paid for {kid_name}.")
     return redirect(url_for("parent_dashboard"))
 
 @app.post("/parent/approve")
 def parent_approve():
-    require_parent()
     family_id = ensure_family_ready()
-    ledger_id_raw = (request.form.get("ledger_id") or "").strip()
+    ledger_id = request.form.get("ledger_id", type=int)
     approve = (request.form.get("approve") or "0") == "1"
-    try:
-        ledger_id = int(ledger_id_raw)
-    except ValueError:
+    if ledger_id is None:
         return redirect(url_for("parent_dashboard"))
     approve_deny_db(family_id, ledger_id, approve)
     return redirect(url_for("parent_dashboard"))
 
+@app.post("/parent/approve_all")
+def parent_approve_all():
+    family_id = ensure_family_ready()
+    # only the entries the parent was shown, not anything logged since
+    ledger_ids = request.form.getlist("ledger_id", type=int)
+    approve_deny_many_db(family_id, ledger_ids, True)
+    return redirect(url_for("parent_dashboard"))
+
 @app.get("/parent/kid/<kid_name>")
 def parent_kid_details(kid_name: str):
-    require_parent()
     family_id = ensure_family_ready()
     kid_name = (kid_name or "").strip()
 
-    rows = ledger_rows(family_id, kid_name)[:200]
-
-    page = """
-    <h1>Chores for {{ kid_name }}</h1>
-
-    <div class="card">
-      {% if rows|length == 0 %}
-        <p>No chores yet.</p>
-      {% else %}
-        <table>
-          <tr><th>When</th><th>Chore</th><th>Amount</th><th>Status</th></tr>
-          {% for r in rows %}
-            <tr>
-              <td>{{ dt(r['ts']) }}</td>
-              <td>{{ r['chore_title'] }}</td>
-              <td>{{ dollars(r['reward_cents']) }}</td>
-              <td>{{ r['status'] }}</td>
-            </tr>
-          {% endfor %}
-        </table>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <a class="btn" href="{{ url_for('parent_dashboard') }}">Back to Parent</a>
-    </div>
-    """
-
-    def dt(ts: float) -> str:
-        return datetime.fromtimestamp(float(ts)).strftime("%Y-%m-%d %H:%M")
+    rows = add_when(ledger_rows(family_id, kid_name, limit=200))
 
-    body = render_template_string(page, kid_name=kid_name, rows=rows, dollars=dollars, dt=dt)
-    return render_template_string(BASE, title="Kid Details", body=body)
+    return render_template("kid_details.html", kid_name=kid_name, rows=rows, dollars=dollars)
 
 @app.get("/parent/chores")
 def parent_edit_chores():
-    require_parent()
     family_id = ensure_family_ready()
     chores = chores_rows(family_id)
-
-    page = """
-    <h1>Edit Chores</h1>
-
-    <div class="card">
-      <h2>Add / Update</h2>
-      <form method="post" action="{{ url_for('parent_save_chore') }}">
-        <div class="row">
-          <input name="chore_key" placeholder="id (example: vacuum)" required />
-          <input name="title" placeholder="title kids see" required />
-          <input name="reward_cents" placeholder="cents (example: 75)" required />
-          <select name="requires_approval">
-            <option value="1">Needs approval</option>
-            <option value="0">Auto-approved</option>
-          </select>
-          <button class="btn btn-primary" type="submit">Save</button>
-        </div>
-      </form>
-      <p><small>100 cents = $1.00</small></p>
-    </div>
-
-    <div class="card">
-      <h2>Current chores</h2>
-      {% if chores|length == 0 %}
-        <p>No chores.</p>
-      {% else %}
-        <table>
-          <tr><th>ID</th><th>Title</th><th>Payout</th><th>Approval</th><th>Delete</th></tr>
-          {% for c in chores %}
-            <tr>
-              <td>{{ c['chore_key'] }}</td>
-              <td>{{ c['title'] }}</td>
-              <td>{{ dollars(c['reward_cents']) }}</td>
-              <td>{% if c['requires_approval'] %}needs approval{% else %}auto{% endif %}</td>
-              <td>
-                <form method="post" action="{{ url_for('parent_delete_chore') }}">
-                  <input type="hidden" name="chore_key" value="{{ c['chore_key'] }}" />
-                  <button class="btn btn-danger" type="submit">Delete</button>
-                </form>
-              </td>
-            </tr>
-          {% endfor %}
-        </table>
-      {% endif %}
-    </div>
-
-    <div class="card">
-      <a class="btn" href="{{ url_for('parent_dashboard') }}">Back to Parent</a>
-    </div>
-    """
-    body = render_template_string(page, chores=chores, dollars=dollars)
-    return render_template_string(BASE, title="Edit Chores", body=body)
+    return render_template("edit_chores.html", chores=chores, dollars=dollars)
 
 @app.post("/parent/chores/save")
 def parent_save_chore():
-    require_parent()
     family_id = ensure_family_ready()
 
-    key = (request.form.get("chore_key") or "").strip()
-    title = (request.form.get("title") or "").strip()
-    raw = (request.form.get("reward_cents") or "0").strip()
+    key = form_text("chore_key")
+    title = form_text("title")
+    cents = form_cents("reward_cents")
     requires = (request.form.get("requires_approval") or "1") == "1"
-    try:
-        cents = int(raw)
-    except ValueError:
-        cents = 0
-    if cents < 0:
-        cents = 0
 
     add_or_update_chore_db(family_id, key, title, cents, requires)
     return redirect(url_for("parent_edit_chores"))
 
 @app.post("/parent/chores/delete")
 def parent_delete_chore():
-    require_parent()
     family_id = ensure_family_ready()
-    key = (request.form.get("chore_key") or "").strip()
+    key = form_text("chore_key")
     delete_chore_db(family_id, key)
     return redirect(url_for("parent_edit_chores"))
 
@@ -922,6 +1192,7 @@ def parent_delete_chore():
 if DATABASE_OK:
     init_db()
 
+# local dev only; serve with `gunicorn app:app` (see gunicorn.conf.py)
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "5000"))
     app.run(host="0.0.0.0", port=port)
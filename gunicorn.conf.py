@@ -0,0 +1,14 @@
+# Gunicorn settings (picked up automatically when run from this folder):
+#   gunicorn app:app
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# threaded workers: requests mostly wait on Postgres, so threads overlap well.
+# Keep threads <= DB_POOL_MAX so every thread can hold a connection.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# reuse the browser's connection across page loads
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "65"))